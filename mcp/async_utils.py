@@ -0,0 +1,51 @@
+"""
+Helpers shared by the Monobank and Wise clients for mixing sync and async code.
+"""
+
+import asyncio
+import concurrent.futures
+from typing import Any, Awaitable, Callable, Dict
+
+import httpx
+
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+    asyncio.run cannot be nested, so when this thread already runs an event loop
+    (e.g. a Jupyter notebook) the coroutine gets a fresh loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+class PerLoopAsyncClient:
+    """
+    Keeps one long-lived httpx.AsyncClient per event loop, created on first use.
+    httpx async connections are bound to the loop that opened them, so each loop
+    gets its own client, kept open to reuse keep-alive connections across calls.
+    """
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]):
+        self._factory = factory
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            # Drop clients left behind by loops that have since closed
+            self._clients = {l: c for l, c in self._clients.items() if not l.is_closed()}
+            client = self._clients[loop] = self._factory()
+        return client
+
+    async def aclose(self):
+        """Close the client bound to the running event loop, if any."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
@@ -10,14 +10,16 @@ Authentication:
 """
 import os
 import time
+import asyncio
 import secrets
 import functools
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 
-from .monobank.client import MonobankClient
+from .monobank.client import MonobankClient, parse_retry_after
 from .wise.client import WiseClient
-from .weekly_report import generate_spending_report
+from .weekly_report import generate_spending_report_async
 
 # Initialize unified FastMCP server
 mcp = FastMCP("Financial")
@@ -30,30 +32,78 @@ MCP_AUTH_TOKEN = os.environ.get("MCP_AUTH_TOKEN")
 # Client Factories
 # ============================================================================
 
+# Clients are created once and reused across tool calls so their connection
+# pools (and Monobank's rate limiter and client-info cache) persist
+_monobank_client: Optional[MonobankClient] = None
+_wise_client: Optional[WiseClient] = None
+_clients_lock = threading.Lock()
+
+
 def get_monobank_client() -> MonobankClient:
-    token = os.environ.get("MONOBANK_API_TOKEN")
-    if not token:
-        raise RuntimeError("MONOBANK_API_TOKEN not found in environment")
-    return MonobankClient(token=token)
+    global _monobank_client
+    with _clients_lock:
+        if _monobank_client is None:
+            token = os.environ.get("MONOBANK_API_TOKEN")
+            if not token:
+                raise RuntimeError("MONOBANK_API_TOKEN not found in environment")
+            _monobank_client = MonobankClient(token=token)
+        return _monobank_client
 
 
 def get_wise_client() -> WiseClient:
-    token = os.environ.get("WISE_API_TOKEN")
-    if not token:
-        raise RuntimeError("WISE_API_TOKEN not found in environment")
-    return WiseClient(token=token)
+    global _wise_client
+    with _clients_lock:
+        if _wise_client is None:
+            token = os.environ.get("WISE_API_TOKEN")
+            if not token:
+                raise RuntimeError("WISE_API_TOKEN not found in environment")
+            _wise_client = WiseClient(token=token)
+        return _wise_client
 
 
 # ============================================================================
 # Utilities
 # ============================================================================
 
+def _is_rate_limit_error(error: Exception) -> bool:
+    error_str = str(error)
+    return "429" in error_str or "Too Many Requests" in error_str
+
+
+def _retry_delay(error: Exception, default: float) -> float:
+    """Prefer the server's Retry-After over our own backoff when it is available."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return default
+    return parse_retry_after(response, default=default)
+
+
 def rate_limit_retry(retries: int = 3, initial_delay: int = 5):
     """
     Decorator to retry function call if a 429 Rate Limit error is encountered.
-    Uses exponential backoff (delay * 2).
+    Uses exponential backoff (delay * 2), or the Retry-After header when present.
+    Coroutine functions wait with asyncio.sleep so the server's event loop
+    keeps serving other clients during the backoff.
     """
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                delay = initial_delay
+                for attempt in range(retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if _is_rate_limit_error(e) and attempt < retries - 1:
+                            wait = _retry_delay(e, delay)
+                            print(f"Rate limit hit in {func.__name__}. Waiting {wait}s before retry {attempt + 1}/{retries}...")
+                            await asyncio.sleep(wait)
+                            delay *= 2
+                            continue
+                        raise e
+                return await func(*args, **kwargs)
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             delay = initial_delay
@@ -61,13 +111,12 @@ def rate_limit_retry(retries: int = 3, initial_delay: int = 5):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    error_str = str(e)
-                    if "429" in error_str or "Too Many Requests" in error_str:
-                        if attempt < retries - 1:
-                            print(f"Rate limit hit in {func.__name__}. Waiting {delay}s before retry {attempt + 1}/{retries}...")
-                            time.sleep(delay)
-                            delay *= 2
-                            continue
+                    if _is_rate_limit_error(e) and attempt < retries - 1:
+                        wait = _retry_delay(e, delay)
+                        print(f"Rate limit hit in {func.__name__}. Waiting {wait}s before retry {attempt + 1}/{retries}...")
+                        time.sleep(wait)
+                        delay *= 2
+                        continue
                     raise e
             return func(*args, **kwargs)
         return wrapper
@@ -80,19 +129,19 @@ def rate_limit_retry(retries: int = 3, initial_delay: int = 5):
 
 @mcp.tool()
 @rate_limit_retry()
-def monobank_get_client_info() -> Dict[str, Any]:
+async def monobank_get_client_info() -> Dict[str, Any]:
     """
     [Monobank] Get detailed information about the client and their accounts.
     Returns:
         JSON object with client name, permissions, and list of accounts.
     """
     client = get_monobank_client()
-    return client.get_client_info()
+    return await asyncio.to_thread(client.get_client_info)
 
 
 @mcp.tool()
 @rate_limit_retry()
-def monobank_get_transactions(account_id: str = "0", days: int = 30) -> List[Dict[str, Any]]:
+async def monobank_get_transactions(account_id: str = "0", days: int = 30) -> List[Dict[str, Any]]:
     """
     [Monobank] Get bank transactions for a specific account over a number of days.
     
@@ -103,38 +152,38 @@ def monobank_get_transactions(account_id: str = "0", days: int = 30) -> List[Dic
         List of transaction objects.
     """
     client = get_monobank_client()
-    return client.get_transactions(account_id=account_id, days=days)
+    return await asyncio.to_thread(client.get_transactions, account_id=account_id, days=days)
 
 
 @mcp.tool()
 @rate_limit_retry()
-def monobank_get_portfolio() -> List[Dict[str, Any]]:
+async def monobank_get_portfolio() -> List[Dict[str, Any]]:
     """
     [Monobank] Get a simplified portfolio view: list of accounts with balance and currency.
     """
     client = get_monobank_client()
-    return client.get_portfolio()
+    return await asyncio.to_thread(client.get_portfolio)
 
 
 @mcp.tool()
 @rate_limit_retry()
-def monobank_get_expense_stats(account_id: str = "0", days: int = 30) -> Dict[str, Any]:
+async def monobank_get_expense_stats(account_id: str = "0", days: int = 30) -> Dict[str, Any]:
     """
     [Monobank] Get spending statistics: total spent, and breakdown by Category (MCC).
     Returns a dictionary with 'total_spent' and 'by_category'.
     """
     client = get_monobank_client()
-    return client.get_expense_stats(account_id=account_id, days=days)
+    return await asyncio.to_thread(client.get_expense_stats, account_id=account_id, days=days)
 
 
 @mcp.tool()
 @rate_limit_retry()
-def monobank_detect_recurring_payments(account_id: str = "0", days: int = 90) -> List[Dict[str, Any]]:
+async def monobank_detect_recurring_payments(account_id: str = "0", days: int = 90) -> List[Dict[str, Any]]:
     """
     [Monobank] Identify potential subscriptions based on repeated transaction amounts and descriptions.
     """
     client = get_monobank_client()
-    return client.detect_recurring_payments(account_id=account_id, days=days)
+    return await asyncio.to_thread(client.detect_recurring_payments, account_id=account_id, days=days)
 
 
 # ============================================================================
@@ -142,32 +191,32 @@ def monobank_detect_recurring_payments(account_id: str = "0", days: int = 90) ->
 # ============================================================================
 
 @mcp.tool()
-def wise_get_profiles() -> List[Dict[str, Any]]:
+async def wise_get_profiles() -> List[Dict[str, Any]]:
     """
     [Wise] List all Wise profiles (Personal, Business) associated with the token.
     """
     client = get_wise_client()
-    return client.get_profiles()
+    return await asyncio.to_thread(client.get_profiles)
 
 
 @mcp.tool()
-def wise_get_balances() -> List[Dict[str, Any]]:
+async def wise_get_balances() -> List[Dict[str, Any]]:
     """
     [Wise] Get balances (jars) for the default (or configured) profile.
     Returns list of accounts with currency and available amounts.
     """
     client = get_wise_client()
-    return client.get_balances()
+    return await asyncio.to_thread(client.get_balances)
 
 
 @mcp.tool()
-def wise_get_transactions(days: int = 30) -> List[Dict[str, Any]]:
+async def wise_get_transactions(days: int = 30) -> List[Dict[str, Any]]:
     """
     [Wise] Get transactions across ALL currency accounts for the last N days.
     Sorted by date descending.
     """
     client = get_wise_client()
-    return client.get_transactions(days=days)
+    return await client.get_transactions_async(days=days)
 
 
 # ============================================================================
@@ -176,7 +225,7 @@ def wise_get_transactions(days: int = 30) -> List[Dict[str, Any]]:
 
 @mcp.tool()
 @rate_limit_retry()
-def generate_report(days: int = 14) -> str:
+async def generate_report(days: int = 14) -> str:
     """
     Generate a comprehensive spending report combining Monobank and Wise transactions.
     
@@ -192,7 +241,15 @@ def generate_report(days: int = 14) -> str:
         - Top 10 largest expenses
         - Daily spending breakdown
     """
-    return generate_spending_report(days=days)
+    # Share the server's clients so the report reuses their caches, limiters and connections.
+    # A missing token is left to the report, which notes that source's error and carries on.
+    clients = {}
+    for name, get_client in (("mono_client", get_monobank_client), ("wise_client", get_wise_client)):
+        try:
+            clients[name] = get_client()
+        except RuntimeError:
+            pass
+    return await generate_spending_report_async(days=days, **clients)
 
 
 # ============================================================================
@@ -1,91 +1,260 @@
 import os
 import time
+import asyncio
+import threading
 import httpx
-import monobank
+import orjson
 import collections
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
+
+from ..async_utils import PerLoopAsyncClient, run_sync
 
 # Rate limit retry settings
-RATE_LIMIT_WAIT_SECONDS = 61  # Monobank rate limit is 1 request per minute
-INTER_ACCOUNT_DELAY = 5  # Small delay between accounts to be gentle on API
+RATE_LIMIT_WAIT_SECONDS = 61  # Fallback wait when a 429 carries no Retry-After header
+STATEMENT_RATE_LIMIT = (1, 60)  # Monobank allows 1 statement request per minute per account
+STATEMENT_MAX_DAYS = 31  # Longest period a single statement request may cover
 MAX_RETRIES = 3
+CLIENT_INFO_TTL = 60  # Seconds to reuse client-info (itself limited to 1 request per minute)
+MAX_CONCURRENT_ACCOUNTS = 8  # Statement limits are per account, so accounts can be fetched in parallel
+
+MONOBANK_API_URL = "https://api.monobank.ua"
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
 
 # Currency code mapping
 CURRENCY_MAP = {980: "UAH", 840: "USD", 978: "EUR", 826: "GBP", 985: "PLN"}
 
 # MCC codes to human-readable categories
 MCC_CATEGORIES = {
-    "4111": "Transportation", "4112": "Railways", "4121": "Taxi & Rideshare",
-    "4131": "Bus Lines", "4784": "Tolls & Fees", "4789": "Transportation Services",
-    "4829": "Money Transfer", "5411": "Groceries", "5412": "Convenience Stores",
-    "5422": "Meat & Seafood", "5441": "Candy & Confectionery", "5451": "Dairy Stores",
-    "5462": "Bakeries", "5499": "Food Stores", "5541": "Gas Stations", "5542": "Fuel",
-    "5651": "Clothing", "5691": "Clothing Stores", "5812": "Restaurants",
-    "5813": "Bars & Nightclubs", "5814": "Fast Food", "5815": "Digital Goods",
-    "5816": "Digital Games", "5817": "Digital Services", "5818": "Digital Purchases",
-    "5912": "Pharmacy", "5921": "Alcohol", "5941": "Sporting Goods",
-    "5942": "Bookstores", "5943": "Office Supplies", "5944": "Jewelry",
-    "5945": "Toys & Games", "5977": "Cosmetics", "5999": "Retail",
-    "6010": "ATM Cash", "6011": "Cash Withdrawal", "6012": "Financial Services",
-    "6051": "Currency Exchange", "6211": "Investments", "6300": "Insurance",
-    "7011": "Hotels", "7230": "Beauty Salons", "7299": "Other Services",
-    "7372": "Software", "7375": "Information Services", "7379": "Computer Services",
-    "7392": "Consulting", "7399": "Business Services", "7512": "Car Rental",
-    "7523": "Parking", "7832": "Cinema", "7941": "Sports Events",
-    "7999": "Recreation Services", "8011": "Medical", "8021": "Dentist",
-    "8099": "Health Services", "8211": "Schools", "8299": "Education",
-    "8398": "Charity", "9311": "Tax Payments", "9399": "Government Services",
+    4111: "Transportation", 4112: "Railways", 4121: "Taxi & Rideshare",
+    4131: "Bus Lines", 4784: "Tolls & Fees", 4789: "Transportation Services",
+    4829: "Money Transfer", 5411: "Groceries", 5412: "Convenience Stores",
+    5422: "Meat & Seafood", 5441: "Candy & Confectionery", 5451: "Dairy Stores",
+    5462: "Bakeries", 5499: "Food Stores", 5541: "Gas Stations", 5542: "Fuel",
+    5651: "Clothing", 5691: "Clothing Stores", 5812: "Restaurants",
+    5813: "Bars & Nightclubs", 5814: "Fast Food", 5815: "Digital Goods",
+    5816: "Digital Games", 5817: "Digital Services", 5818: "Digital Purchases",
+    5912: "Pharmacy", 5921: "Alcohol", 5941: "Sporting Goods",
+    5942: "Bookstores", 5943: "Office Supplies", 5944: "Jewelry",
+    5945: "Toys & Games", 5977: "Cosmetics", 5999: "Retail",
+    6010: "ATM Cash", 6011: "Cash Withdrawal", 6012: "Financial Services",
+    6051: "Currency Exchange", 6211: "Investments", 6300: "Insurance",
+    7011: "Hotels", 7230: "Beauty Salons", 7299: "Other Services",
+    7372: "Software", 7375: "Information Services", 7379: "Computer Services",
+    7392: "Consulting", 7399: "Business Services", 7512: "Car Rental",
+    7523: "Parking", 7832: "Cinema", 7941: "Sports Events",
+    7999: "Recreation Services", 8011: "Medical", 8021: "Dentist",
+    8099: "Health Services", 8211: "Schools", 8299: "Education",
+    8398: "Charity", 9311: "Tax Payments", 9399: "Government Services",
 }
 
 
 def get_mcc_category(mcc: int) -> str:
     """Convert MCC code to human-readable category name."""
-    return MCC_CATEGORIES.get(str(mcc), f"Other ({mcc})")
+    # `or` builds the fallback string only on a miss; .get(mcc, default) would build it every call
+    return MCC_CATEGORIES.get(mcc) or f"Other ({mcc})"
+
+
+def parse_retry_after(response: httpx.Response, default: float = RATE_LIMIT_WAIT_SECONDS) -> float:
+    """Read the Retry-After header (in seconds) from a 429 response."""
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, ValueError):
+        return default
+
+
+class AsyncLimiter:
+    """
+    Leaky-bucket rate limiter: allows bursts of up to `max_rate` acquisitions,
+    then paces them to `max_rate` per `time_period` seconds.
+    Not bound to an event loop, so one instance can outlive several asyncio.run calls.
+    Thread-safe: the blocking client shares buckets across to_thread workers.
+    """
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Take a slot if one is free; otherwise return how long to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_check
+            self._level = max(self._level - elapsed * self._rate_per_sec, 0.0)
+            self._last_check = now
+            if self._level + 1 <= self.max_rate:
+                self._level += 1
+                return 0.0
+            return (self._level + 1 - self.max_rate) / self._rate_per_sec
+
+    def delay(self) -> float:
+        """Seconds until a slot frees up, without taking one."""
+        with self._lock:
+            level = max(self._level - (time.monotonic() - self._last_check) * self._rate_per_sec, 0.0)
+            return max((level + 1 - self.max_rate) / self._rate_per_sec, 0.0)
+
+    async def acquire(self):
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self):
+        """Synchronous acquire for the blocking client; shares the bucket with acquire()."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+class BackoffGate:
+    """
+    Pauses every fetch while at least one of them is backing off from a 429.
+    The gate reopens only when the last overlapping back-off ends.
+    """
+    def __init__(self):
+        self._open = asyncio.Event()
+        self._open.set()
+        self._active = 0
+
+    async def wait(self):
+        await self._open.wait()
+
+    async def backoff(self, seconds: float):
+        self._active += 1
+        self._open.clear()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self._active -= 1
+            if not self._active:
+                self._open.set()
 
 
 class MonobankClient:
     """
-    Higher-level wrapper around the official python-monobank client.
+    Higher-level wrapper around the Monobank personal API.
     """
     def __init__(self, token: Optional[str] = None):
         self.token = token or os.environ.get("MONOBANK_API_TOKEN")
         if not self.token:
             raise ValueError("Monobank API token is required (MONOBANK_API_TOKEN env var)")
         
-        self.client = monobank.Client(self.token)
+        # Long-lived HTTP/2 client: keep-alive connections are reused across calls
+        # and chunked statement requests share one multiplexed connection
+        self._http = httpx.Client(
+            base_url=MONOBANK_API_URL,
+            headers={"X-Token": self.token},
+            timeout=30.0,
+            http2=True,
+            limits=HTTP_LIMITS
+        )
+        # HTTP/2 lets the concurrent statement requests share one connection
+        self._async_clients = PerLoopAsyncClient(lambda: httpx.AsyncClient(
+            base_url=MONOBANK_API_URL,
+            headers={"X-Token": self.token},
+            timeout=30.0,
+            http2=True,
+            limits=HTTP_LIMITS
+        ))
+        # Statement limiters keyed by account id
+        self._limiters: Dict[str, AsyncLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        self._client_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Accounts excluded from get_all_transactions (each costs a rate-limited statement call)
+        self._skip_account_ids = {
+            acc_id.strip() for acc_id in os.environ.get("MONOBANK_SKIP_ACCOUNT_IDS", "").split(",") if acc_id.strip()
+        }
+        self._skip_empty_accounts = os.environ.get("MONOBANK_SKIP_EMPTY_ACCOUNTS", "").lower() in ("1", "true", "yes")
+
+    def _should_skip_account(self, acc: Dict[str, Any]) -> bool:
+        """
+        Decide whether an account's statement is worth fetching.
+        Empty FOP accounts are always skipped; other accounts with zero balance and
+        no credit limit only when MONOBANK_SKIP_EMPTY_ACCOUNTS is set, since they may
+        still have been spent down to zero within the period.
+        """
+        if acc.get("id") in self._skip_account_ids:
+            return True
+        if acc.get("balance", 0) != 0:
+            return False
+        if acc.get("type") == "fop":
+            return True
+        return self._skip_empty_accounts and acc.get("creditLimit", 0) == 0
+
+    def _get_limiter(self, account_id: str) -> AsyncLimiter:
+        # Tool calls run in worker threads, so two may ask for the same account at once
+        with self._limiters_lock:
+            limiter = self._limiters.get(account_id)
+            if limiter is None:
+                limiter = self._limiters[account_id] = AsyncLimiter(*STATEMENT_RATE_LIMIT)
+            return limiter
+
+    def _cached_client_info(self) -> Optional[Dict[str, Any]]:
+        """Return client info fetched within the last CLIENT_INFO_TTL seconds, if any."""
+        if self._client_info_cache and time.monotonic() - self._client_info_cache[0] < CLIENT_INFO_TTL:
+            return self._client_info_cache[1]
+        return None
+
+    def _store_client_info(self, response: httpx.Response) -> Dict[str, Any]:
+        """Decode a /personal/client-info response and cache it for CLIENT_INFO_TTL seconds."""
+        response.raise_for_status()
+        info = orjson.loads(response.content)
+        self._client_info_cache = (time.monotonic(), info)
+        return info
 
     def get_client_info(self) -> Dict[str, Any]:
-        """Retrieve raw client info."""
-        return self.client.get_client_info()
+        """Retrieve raw client info (cached for CLIENT_INFO_TTL seconds)."""
+        info = self._cached_client_info()
+        if info is None:
+            info = self._store_client_info(self._http.get("/personal/client-info"))
+        return info
 
     def get_transactions(self, account_id: str = "0", days: int = 30) -> List[Dict[str, Any]]:
         """
         Retrieve statement for a specific time range.
-        Automatically chunks requests if days > 30.
+        Automatically chunks requests if days > 31, pacing the chunks to the
+        per-account statement limit instead of running into 429s.
         """
         now = datetime.now()
         start_date = now - timedelta(days=days)
+        limiter = self._get_limiter(account_id)
         all_txs = []
         
-        # Chunk into 30-day intervals
+        # Chunk into intervals of at most STATEMENT_MAX_DAYS
         current_start = start_date
         while current_start < now:
-            current_end = current_start + timedelta(days=30)
+            current_end = current_start + timedelta(days=STATEMENT_MAX_DAYS)
             if current_end > now:
                 current_end = now
                 
             # Fetch chunk
+            limiter.acquire_blocking()
             try:
-                txs = self.client.get_statements(account_id, current_start, current_end)
-                all_txs.extend(txs)
-            except Exception as e:
-                if "429" in str(e):
+                response = self._http.get(
+                    f"/personal/statement/{account_id}/{int(current_start.timestamp())}/{int(current_end.timestamp())}"
+                )
+                response.raise_for_status()
+                all_txs.extend(orjson.loads(response.content))
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
                     print(f"Rate limit reached fetching transactions: {e}. Returning partial data.")
                     break
-                elif "400" in str(e):
-                     print(f"Date range invalid: {e}")
-                     break
+                elif e.response.status_code == 400:
+                    print(f"Date range invalid: {e}")
+                    break
                 else:
                     raise e
             
@@ -102,7 +271,7 @@ class MonobankClient:
         for acc in info.get("accounts", []):
             balance_raw = acc.get("balance", 0)
             currency_code = acc.get("currencyCode")
-            currency = {980: "UAH", 840: "USD", 978: "EUR"}.get(currency_code, str(currency_code))
+            currency = CURRENCY_MAP.get(currency_code, str(currency_code))
             
             accounts.append({
                 "id": acc.get("id"),
@@ -119,25 +288,21 @@ class MonobankClient:
         Get spending statistics: total spent, and breakdown by Category (MCC).
         """
         txs = self.get_transactions(account_id, days)
-        by_mcc = collections.defaultdict(float)
-        
-        total_expense = 0.0
+        # Accumulate integer kopecks; convert to currency units once at the end
+        by_mcc = collections.defaultdict(int)
         
         for tx in txs:
             amount = tx.get("amount", 0)
             if amount < 0:
-                amount_abs = abs(amount) / 100.0
-                mcc = str(tx.get("mcc", "Unknown"))
-                
-                by_mcc[mcc] += amount_abs
-                total_expense += amount_abs
-                
-        sorted_mcc = dict(sorted(by_mcc.items(), key=lambda i: i[1], reverse=True))
+                by_mcc[tx.get("mcc", "Unknown")] -= amount
+        
+        # Sort and convert in one pass; dicts keep insertion (i.e. sorted) order
+        sorted_mcc = sorted(by_mcc.items(), key=itemgetter(1), reverse=True)
         
         return {
             "period_days": days,
-            "total_spent": round(total_expense, 2),
-            "by_category": {k: round(v, 2) for k, v in sorted_mcc.items()}
+            "total_spent": sum(by_mcc.values()) / 100.0,
+            "by_category": {str(k): v / 100.0 for k, v in sorted_mcc}
         }
 
     def detect_recurring_payments(self, account_id: str = "0", days: int = 90) -> List[Dict[str, Any]]:
@@ -145,125 +310,164 @@ class MonobankClient:
         Identify potential subscriptions based on repeated transaction descriptions and amounts.
         """
         transactions = self.get_transactions(account_id, days)
-        groups = collections.defaultdict(list)
+        # Running [count, first, last] per (description, amount) group, filled in one pass
+        groups: Dict[Tuple[str, int], List[int]] = {}
         
         for tx in transactions:
             amount = tx.get('amount', 0)
-            desc = tx.get('description', '').strip()
             
+            # Group by integer kopecks: exact and cheaper to hash than floats
             if amount < 0:
-                amount_abs = abs(amount) / 100.0
-                if amount_abs > 0:
-                    groups[(desc, amount_abs)].append(tx)
+                key = (tx.get('description', '').strip(), -amount)
+                t = tx.get('time')
+                acc = groups.get(key)
+                if acc is None:
+                    groups[key] = [1, t, t]
+                else:
+                    acc[0] += 1
+                    if t < acc[1]:
+                        acc[1] = t
+                    elif t > acc[2]:
+                        acc[2] = t
         
         recurring = []
-        for (desc, amount), txs in groups.items():
-            if len(txs) > 1:
-                times = sorted([tx.get('time') for tx in txs])
-                intervals = []
-                for i in range(1, len(times)):
-                    intervals.append(times[i] - times[i-1])
-                
-                avg_interval_sec = sum(intervals) / len(intervals) if intervals else 0
-                avg_interval_days = avg_interval_sec / (24 * 3600)
+        for (desc, amount_cents), (count, first, last) in groups.items():
+            if count > 1:
+                # The mean of consecutive gaps telescopes to (last - first) / (count - 1)
+                avg_interval_days = (last - first) / (count - 1) / (24 * 3600)
                 
                 recurring.append({
                     "description": desc,
-                    "amount": amount,
-                    "count": len(txs),
+                    "amount": amount_cents / 100.0,
+                    "count": count,
                     "avg_interval_days": round(avg_interval_days, 1),
-                    "last_transaction": datetime.fromtimestamp(times[-1]).isoformat()
+                    "last_transaction": datetime.fromtimestamp(last).isoformat()
                 })
         
-        return sorted(recurring, key=lambda x: x['count'], reverse=True)
+        return sorted(recurring, key=itemgetter('count'), reverse=True)
 
     def get_all_transactions(self, days: int = 14) -> List[Dict[str, Any]]:
         """
         Fetch transactions from ALL accounts using direct HTTP calls.
         Returns normalized transaction objects with consistent structure.
         """
-        headers = {"X-Token": self.token}
+        async def run():
+            try:
+                return await self.get_all_transactions_async(days=days)
+            finally:
+                await self.aclose()
+        return run_sync(run())
+
+    async def get_all_transactions_async(self, days: int = 14, concurrency: int = MAX_CONCURRENT_ACCOUNTS) -> List[Dict[str, Any]]:
+        """
+        Async variant of get_all_transactions.
+        Account statements are fetched concurrently, bounded by `concurrency`.
+        """
         now = datetime.now()
         start_date = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        # Closed while any account is backing off from a 429,
+        # so the other accounts pause instead of piling onto the limit
+        backoff_gate = BackoffGate()
+        client = self._async_clients.get()
         
-        all_transactions = []
+        info = self._cached_client_info()
+        if info is None:
+            info = self._store_client_info(await client.get("/personal/client-info"))
         
-        with httpx.Client(base_url="https://api.monobank.ua", headers=headers, timeout=30.0) as client:
-            info_response = client.get("/personal/client-info")
-            info_response.raise_for_status()
-            info = info_response.json()
-            
-            accounts = info.get("accounts", [])
-            
-            for idx, acc in enumerate(accounts):
-                account_id = acc.get("id")
-                currency_code = acc.get("currencyCode")
-                currency = CURRENCY_MAP.get(currency_code, str(currency_code))
-                acc_type = acc.get("type", "unknown")
-                
-                if acc_type == "fop" and acc.get("balance", 0) == 0:
-                    continue
+        accounts = [acc for acc in info.get("accounts", []) if not self._should_skip_account(acc)]
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        results = await asyncio.gather(*(
+            self._fetch_account_transactions(client, semaphore, backoff_gate, acc, start_date, now)
+            for acc in accounts
+        ))
+        
+        all_transactions = [tx for account_txs in results for tx in account_txs]
+        return sorted(all_transactions, key=itemgetter("date"), reverse=True)
+
+    async def _fetch_account_transactions(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        backoff_gate: BackoffGate,
+        acc: Dict[str, Any],
+        start_date: datetime,
+        now: datetime
+    ) -> List[Dict[str, Any]]:
+        """Fetch and normalize the statement of a single account, retrying on rate limits."""
+        account_id = acc.get("id")
+        currency_code = acc.get("currencyCode")
+        currency = CURRENCY_MAP.get(currency_code, str(currency_code))
+        acc_type = acc.get("type", "unknown")
+        
+        start_ts = int(start_date.timestamp())
+        end_ts = int(now.timestamp())
+        
+        limiter = self._get_limiter(account_id)
+        account_transactions = []
+        
+        # Retry loop for rate limits
+        for attempt in range(MAX_RETRIES):
+            try:
+                await backoff_gate.wait()
+                # Take the limiter slot last, so it is stamped when the request is actually sent
+                async with semaphore:
+                    async with limiter:
+                        statement_response = await client.get(f"/personal/statement/{account_id}/{start_ts}/{end_ts}")
+                statement_response.raise_for_status()
+                transactions = orjson.loads(statement_response.content)
                 
-                # Small delay between accounts to be gentle on API
-                if idx > 0:
-                    time.sleep(INTER_ACCOUNT_DELAY)
+                if not isinstance(transactions, list):
+                    break
                 
-                start_ts = int(start_date.timestamp())
-                end_ts = int(now.timestamp())
+                for tx in transactions:
+                    # Filter on the raw epoch seconds so out-of-range rows never build a datetime
+                    tx_time = tx.get("time", 0)
+                    if tx_time < start_ts or tx_time > end_ts:
+                        continue
+                    
+                    tx_date = datetime.fromtimestamp(tx_time)
+                    amount = tx.get("amount", 0) / 100.0
+                    mcc = tx.get("mcc", 0)
+                    
+                    account_transactions.append({
+                        "date": tx_date,
+                        "description": tx.get("description", "Unknown"),
+                        "amount": amount,
+                        "currency": currency,
+                        "mcc": str(mcc),
+                        "category": get_mcc_category(mcc),
+                        "source": "Monobank",
+                        "account_type": acc_type,
+                        "is_expense": amount < 0
+                    })
                 
-                # Retry loop for rate limits
-                for attempt in range(MAX_RETRIES):
-                    try:
-                        statement_response = client.get(f"/personal/statement/{account_id}/{start_ts}/{end_ts}")
-                        statement_response.raise_for_status()
-                        transactions = statement_response.json()
-                        
-                        if not isinstance(transactions, list):
-                            break
-                        
-                        for tx in transactions:
-                            tx_time = tx.get("time", 0)
-                            tx_date = datetime.fromtimestamp(tx_time)
-                            
-                            if tx_date < start_date or tx_date > now:
-                                continue
-                            
-                            amount = tx.get("amount", 0) / 100.0
-                            mcc = tx.get("mcc", 0)
-                            
-                            all_transactions.append({
-                                "date": tx_date,
-                                "description": tx.get("description", "Unknown"),
-                                "amount": amount,
-                                "currency": currency,
-                                "mcc": str(mcc),
-                                "category": get_mcc_category(mcc),
-                                "source": "Monobank",
-                                "account_type": acc_type,
-                                "is_expense": amount < 0
-                            })
-                        
-                        # Success - break out of retry loop
-                        break
-                            
-                    except httpx.HTTPStatusError as e:
-                        if e.response.status_code == 429:
-                            if attempt < MAX_RETRIES - 1:
-                                wait_time = RATE_LIMIT_WAIT_SECONDS * (attempt + 1)
-                                print(f"   ⏳ Rate limit hit for {acc_type}/{currency}. Waiting {wait_time}s before retry {attempt + 1}/{MAX_RETRIES}...")
-                                time.sleep(wait_time)
-                                continue
-                            else:
-                                print(f"   ⚠️  Rate limit hit for {acc_type}/{currency}. Max retries exceeded.")
-                        else:
-                            print(f"   ⚠️  Error fetching {acc_type}/{currency}: {e}")
-                        break
-                    except Exception as e:
-                        print(f"   ⚠️  Error: {e}")
-                        break
+                # Success - break out of retry loop
+                break
+                    
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    if attempt < MAX_RETRIES - 1:
+                        retry_after = parse_retry_after(e.response)
+                        # The limiter may hold this account's retry for longer than Retry-After
+                        wait_time = max(retry_after, limiter.delay())
+                        print(f"   ⏳ Rate limit hit for {acc_type}/{currency}. Waiting {wait_time:.0f}s before retry {attempt + 1}/{MAX_RETRIES}...")
+                        await backoff_gate.backoff(retry_after)
+                        continue
+                    else:
+                        print(f"   ⚠️  Rate limit hit for {acc_type}/{currency}. Max retries exceeded.")
+                else:
+                    print(f"   ⚠️  Error fetching {acc_type}/{currency}: {e}")
+                break
+            except Exception as e:
+                print(f"   ⚠️  Error: {e}")
+                break
         
-        return sorted(all_transactions, key=lambda x: x["date"], reverse=True)
+        return account_transactions
 
-    def close(self):
-        pass
+    async def aclose(self):
+        """Close the async client bound to the running event loop, if any."""
+        await self._async_clients.aclose()
 
+    def close(self):
+        self._http.close()
@@ -4,18 +4,28 @@ Weekly Spending Report Generator
 Generates beautiful markdown reports from Monobank and Wise transactions.
 """
 
+import io
+import heapq
+import asyncio
 from datetime import datetime, timedelta
 from collections import defaultdict
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 
 from .monobank.client import MonobankClient
 from .wise.client import WiseClient
+from .async_utils import run_sync
+
+
+CURRENCY_SYMBOLS = {"UAH": "₴", "USD": "$", "EUR": "€", "GBP": "£", "PLN": "zł"}
+
+# Percentage bars for the category table: _BARS[i] has i filled cells out of 20
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
 
 
 def format_currency(amount: float, currency: str) -> str:
     """Format amount with currency symbol."""
-    symbols = {"UAH": "₴", "USD": "$", "EUR": "€", "GBP": "£", "PLN": "zł"}
-    symbol = symbols.get(currency, currency + " ")
+    symbol = CURRENCY_SYMBOLS.get(currency) or currency + " "
     return f"{symbol}{amount:,.2f}"
 
 
@@ -34,32 +44,67 @@ def fetch_all_transactions(
     Returns:
         List of normalized transaction objects sorted by date descending.
     """
+    return run_sync(fetch_all_transactions_async(days=days, banks=banks))
+
+
+async def _fetch_monobank_transactions(days: int, mono_client: Optional[MonobankClient] = None) -> List[Dict[str, Any]]:
+    if mono_client is not None:
+        return await mono_client.get_all_transactions_async(days=days)
+    
+    mono_client = MonobankClient()
+    try:
+        return await mono_client.get_all_transactions_async(days=days)
+    finally:
+        await mono_client.aclose()
+        mono_client.close()
+
+
+async def _fetch_wise_transactions(days: int, wise_client: Optional[WiseClient] = None) -> List[Dict[str, Any]]:
+    if wise_client is not None:
+        return await wise_client.get_all_transactions_async(days=days)
+    
+    wise_client = WiseClient()
+    try:
+        return await wise_client.get_all_transactions_async(days=days)
+    finally:
+        await wise_client.aclose()
+        wise_client.close()
+
+
+async def fetch_all_transactions_async(
+    days: int = 14,
+    banks: Optional[List[str]] = None,
+    mono_client: Optional[MonobankClient] = None,
+    wise_client: Optional[WiseClient] = None
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of fetch_all_transactions.
+    
+    Monobank and Wise are fetched concurrently; a failure in one source
+    is reported and does not discard the other.
+    Pass long-lived clients to share their caches, rate limiters and connections;
+    otherwise a client is created and closed for this call.
+    """
     if banks is None:
         banks = ["mono", "wise"]
     
-    all_txs = []
-    
-    # Fetch from Monobank
+    sources = []
     if "mono" in banks:
-        try:
-            mono_client = MonobankClient()
-            monobank_txs = mono_client.get_all_transactions(days=days)
-            mono_client.close()
-            all_txs.extend(monobank_txs)
-        except Exception as e:
-            print(f"Monobank error: {e}")
-    
-    # Fetch from Wise
+        sources.append(("Monobank", _fetch_monobank_transactions(days, mono_client)))
     if "wise" in banks:
-        try:
-            wise_client = WiseClient()
-            wise_txs = wise_client.get_all_transactions(days=days)
-            wise_client.close()
-            all_txs.extend(wise_txs)
-        except Exception as e:
-            print(f"Wise error: {e}")
+        sources.append(("Wise", _fetch_wise_transactions(days, wise_client)))
+    
+    results = await asyncio.gather(*(coro for _, coro in sources), return_exceptions=True)
     
-    return sorted(all_txs, key=lambda x: x["date"], reverse=True)
+    runs = []
+    for (name, _), result in zip(sources, results):
+        if isinstance(result, Exception):
+            print(f"{name} error: {result}")
+            continue
+        runs.append(result)
+    
+    # Each source returns its transactions newest-first, so merge instead of re-sorting
+    return list(heapq.merge(*runs, key=itemgetter("date"), reverse=True))
 
 
 def generate_report(all_txs: List[Dict[str, Any]], days: int = 14) -> str:
@@ -76,44 +121,63 @@ def generate_report(all_txs: List[Dict[str, Any]], days: int = 14) -> str:
     end_date = datetime.now()
     start_date = (end_date - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
     
-    # Separate expenses from income
-    expenses = [tx for tx in all_txs if tx["is_expense"]]
-    income = [tx for tx in all_txs if not tx["is_expense"]]
+    # strftime is relatively slow and most transactions share a day,
+    # so each calendar day is formatted only once: ("%b %d", "%a %d")
+    day_labels = {}
     
-    # Calculate totals by currency
-    expense_by_currency = defaultdict(float)
-    for tx in expenses:
-        expense_by_currency[tx["currency"]] += abs(tx["amount"])
+    def format_day(date: datetime) -> tuple:
+        key = date.toordinal()
+        labels = day_labels.get(key)
+        if labels is None:
+            labels = day_labels[key] = (date.strftime("%b %d"), date.strftime("%a %d"))
+        return labels
     
+    # Aggregate everything in a single pass over the transactions
+    expenses = []
+    income = []
+    expense_by_currency = defaultdict(float)
     income_by_currency = defaultdict(float)
-    for tx in income:
-        income_by_currency[tx["currency"]] += abs(tx["amount"])
-    
-    # Expenses by category
     by_category = defaultdict(lambda: defaultdict(float))
-    for tx in expenses:
-        by_category[tx["currency"]][tx["category"]] += abs(tx["amount"])
+    daily = defaultdict(lambda: defaultdict(float))
+    
+    for tx in all_txs:
+        amount = abs(tx["amount"])
+        currency = tx["currency"]
+        if tx["is_expense"]:
+            expenses.append(tx)
+            expense_by_currency[currency] += amount
+            by_category[currency][tx["category"]] += amount
+            daily[format_day(tx["date"])[1]][currency] += amount
+        else:
+            income.append(tx)
+            income_by_currency[currency] += amount
     
     # Build report
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
+    
+    def line(text: str = ""):
+        write(text)
+        write("\n")
     
     # Header
     period_name = "Weekly" if days <= 7 else f"{days}-Day"
-    lines.append(f"# 📊 {period_name} Spending Report")
-    lines.append("")
-    lines.append(f"**Period:** {start_date.strftime('%B %d')} – {end_date.strftime('%B %d, %Y')}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    line(f"# 📊 {period_name} Spending Report")
+    line()
+    line(f"**Period:** {start_date.strftime('%B %d')} – {end_date.strftime('%B %d, %Y')}")
+    line()
+    line("---")
+    line()
     
     # ALL TRANSACTIONS LIST
-    lines.append("## 📋 All Transactions")
-    lines.append("")
-    lines.append("| Date | Description | Amount | Category | Source |")
-    lines.append("|:-----|:------------|-------:|:---------|:------:|")
+    line("## 📋 All Transactions")
+    line()
+    line("| Date | Description | Amount | Category | Source |")
+    line("|:-----|:------------|-------:|:---------|:------:|")
     
     for tx in all_txs:
-        date_str = tx["date"].strftime("%b %d %H:%M")
+        date = tx["date"]
+        date_str = f"{format_day(date)[0]} {date.hour:02d}:{date.minute:02d}"
         desc = tx["description"][:40] + "..." if len(tx["description"]) > 40 else tx["description"]
         
         amt = tx["amount"]
@@ -127,29 +191,29 @@ def generate_report(all_txs: List[Dict[str, Any]], days: int = 14) -> str:
         acc_type = tx.get("account_type", "")
         source_label = f"{source_emoji} {acc_type}" if acc_type else tx["source"]
         
-        lines.append(f"| {date_str} | {desc} | {amount_str} | {category} | {source_label} |")
+        buf.writelines(("| ", date_str, " | ", desc, " | ", amount_str, " | ", category, " | ", source_label, " |\n"))
     
-    lines.append("")
-    lines.append(f"*Total: {len(all_txs)} transactions ({len(expenses)} expenses, {len(income)} income)*")
-    lines.append("")
+    line()
+    line(f"*Total: {len(all_txs)} transactions ({len(expenses)} expenses, {len(income)} income)*")
+    line()
     
     # Summary
-    lines.append("---")
-    lines.append("")
-    lines.append("## 💰 Summary")
-    lines.append("")
-    lines.append("### Expenses")
+    line("---")
+    line()
+    line("## 💰 Summary")
+    line()
+    line("### Expenses")
     for currency in sorted(expense_by_currency.keys()):
         amount = expense_by_currency[currency]
-        lines.append(f"- **{currency}**: {format_currency(amount, currency)}")
+        line(f"- **{currency}**: {format_currency(amount, currency)}")
     
     if income_by_currency:
-        lines.append("")
-        lines.append("### Income")
+        line()
+        line("### Income")
         for currency in sorted(income_by_currency.keys()):
             amount = income_by_currency[currency]
-            lines.append(f"- **{currency}**: +{format_currency(amount, currency)}")
-    lines.append("")
+            line(f"- **{currency}**: +{format_currency(amount, currency)}")
+    line()
     
     # Expenses by category (per currency)
     for currency in sorted(by_category.keys()):
@@ -159,52 +223,47 @@ def generate_report(all_txs: List[Dict[str, Any]], days: int = 14) -> str:
             
         total = sum(categories.values())
         
-        lines.append("---")
-        lines.append("")
-        lines.append(f"## 📂 {currency} Expenses by Category")
-        lines.append("")
-        lines.append("| Category | Amount | % |")
-        lines.append("|:---------|-------:|--:|")
+        line("---")
+        line()
+        line(f"## 📂 {currency} Expenses by Category")
+        line()
+        line("| Category | Amount | % |")
+        line("|:---------|-------:|--:|")
         
-        sorted_cats = sorted(categories.items(), key=lambda x: x[1], reverse=True)
+        sorted_cats = sorted(categories.items(), key=itemgetter(1), reverse=True)
         for category, amount in sorted_cats:
             pct = (amount / total * 100) if total > 0 else 0
-            bar = "█" * int(pct / 5) + "░" * (20 - int(pct / 5))
-            lines.append(f"| {category} | {format_currency(amount, currency)} | {pct:.0f}% {bar} |")
+            bar = _BARS[min(int(pct / 5), 20)]
+            line(f"| {category} | {format_currency(amount, currency)} | {pct:.0f}% {bar} |")
         
-        lines.append(f"| **Total** | **{format_currency(total, currency)}** | |")
-        lines.append("")
+        line(f"| **Total** | **{format_currency(total, currency)}** | |")
+        line()
     
     # Top expenses
     if expenses:
-        top_expenses = sorted(expenses, key=lambda x: abs(x["amount"]), reverse=True)[:10]
+        top_expenses = heapq.nlargest(10, expenses, key=lambda x: abs(x["amount"]))
         
-        lines.append("---")
-        lines.append("")
-        lines.append("## 🔝 Top 10 Expenses")
-        lines.append("")
-        lines.append("| # | Date | Description | Amount | Source |")
-        lines.append("|:-:|:-----|:------------|-------:|:------:|")
+        line("---")
+        line()
+        line("## 🔝 Top 10 Expenses")
+        line()
+        line("| # | Date | Description | Amount | Source |")
+        line("|:-:|:-----|:------------|-------:|:------:|")
         
         for i, tx in enumerate(top_expenses, 1):
-            date_str = tx["date"].strftime("%b %d")
+            date_str = format_day(tx["date"])[0]
             desc = tx["description"][:35] + "..." if len(tx["description"]) > 35 else tx["description"]
             amount_str = format_currency(abs(tx["amount"]), tx["currency"])
             source_emoji = "🏦" if tx["source"] == "Monobank" else "🌍"
-            lines.append(f"| {i} | {date_str} | {desc} | {amount_str} | {source_emoji} {tx['source']} |")
-        lines.append("")
+            line(f"| {i} | {date_str} | {desc} | {amount_str} | {source_emoji} {tx['source']} |")
+        line()
     
     # Daily breakdown
-    daily = defaultdict(lambda: defaultdict(float))
-    for tx in expenses:
-        day = tx["date"].strftime("%a %d")
-        daily[day][tx["currency"]] += abs(tx["amount"])
-    
     if daily:
-        lines.append("---")
-        lines.append("")
-        lines.append("## 📅 Daily Spending")
-        lines.append("")
+        line("---")
+        line()
+        line("## 📅 Daily Spending")
+        line()
         
         all_currencies = set()
         for day_data in daily.values():
@@ -213,29 +272,32 @@ def generate_report(all_txs: List[Dict[str, Any]], days: int = 14) -> str:
         
         header = "| Day |" + " | ".join(all_currencies) + " |"
         separator = "|:----|" + "|".join(["-----:" for _ in all_currencies]) + "|"
-        lines.append(header)
-        lines.append(separator)
+        line(header)
+        line(separator)
         
-        current = start_date
-        while current <= end_date:
-            day = current.strftime("%a %d")
-            row = f"| {day} |"
+        period_days = [
+            format_day(start_date + timedelta(days=offset))[1]
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        for day in period_days:
+            day_totals = daily.get(day, {})
+            parts = ["| ", day, " |"]
             for curr in all_currencies:
-                amt = daily[day].get(curr, 0)
+                amt = day_totals.get(curr, 0)
                 if amt > 0:
-                    row += f" {format_currency(amt, curr)} |"
+                    parts.append(f" {format_currency(amt, curr)} |")
                 else:
-                    row += " — |"
-            lines.append(row)
-            current += timedelta(days=1)
-        lines.append("")
+                    parts.append(" — |")
+            parts.append("\n")
+            buf.writelines(parts)
+        line()
     
     # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+    line("---")
+    line()
+    write(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_spending_report(
@@ -259,3 +321,18 @@ def generate_spending_report(
     transactions = fetch_all_transactions(days=days, banks=banks)
     return generate_report(transactions, days=days)
 
+
+async def generate_spending_report_async(
+    days: int = 14,
+    banks: Optional[List[str]] = None,
+    mono_client: Optional[MonobankClient] = None,
+    wise_client: Optional[WiseClient] = None
+) -> str:
+    """
+    Async variant of generate_spending_report, for use inside a running event loop.
+    See fetch_all_transactions_async for the optional client arguments.
+    """
+    transactions = await fetch_all_transactions_async(
+        days=days, banks=banks, mono_client=mono_client, wise_client=wise_client
+    )
+    return generate_report(transactions, days=days)
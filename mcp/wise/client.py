@@ -1,9 +1,29 @@
 import os
 import re
+import time
+import heapq
+import asyncio
+import functools
 import httpx
-from typing import Optional, Dict, List, Any
+import orjson
+from operator import itemgetter
+from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 
+from ..async_utils import PerLoopAsyncClient
+
+# Connection pool shared by the sync and async clients; Wise supports HTTP/2,
+# so concurrent requests multiplex over a single kept-alive connection
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60.0)
+# Transport-level retries only cover connection failures, never HTTP errors
+CONNECT_RETRIES = 2
+PROFILE_ID_TTL = 3600  # Seconds to reuse a discovered profile id before asking /profiles again
+BALANCE_TTL = 300  # Default seconds to reuse the jar list (override with WISE_BALANCE_TTL)
+
+# Statuses worth reporting, checked once per transfer/activity
+TRANSFER_STATUSES = frozenset({"outgoing_payment_sent", "funds_converted"})
+CARD_PAYMENT_STATUSES = frozenset({"COMPLETED", "PENDING"})
+
 
 def parse_amount_string(amount_str: str) -> tuple[float, str]:
     """Parse amount string like '1.40 EUR' or '3,300 EUR' into (amount, currency)."""
@@ -24,6 +44,222 @@ def parse_amount_string(amount_str: str) -> tuple[float, str]:
     return 0.0, "EUR"
 
 
+def _env_seconds(name: str, default: float) -> float:
+    """Read a duration from the environment, falling back to `default` if unset or invalid."""
+    try:
+        return float(os.environ.get(name) or default)
+    except ValueError:
+        return float(default)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse a Wise timestamp ('2024-01-31 12:00:00' or ISO-8601 with 'Z') into a naive datetime.
+    Raises ValueError for malformed values.
+    """
+    if value.endswith("Z"):
+        # fromisoformat only accepts 'Z' from Python 3.11
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+# Merchant keywords per category, checked in order (so "amazon prime" is a
+# subscription before "amazon" counts as shopping)
+MERCHANT_CATEGORIES = (
+    ("Transport", ("uber", "bolt", "lyft", "taxi", "cabify")),
+    ("Groceries", ("lidl", "aldi", "pingo doce", "continente", "mercado", "supermarket", "grocery")),
+    ("Restaurants", ("restaurant", "cafe", "coffee", "starbucks", "mcdonald", "burger", "pizza", "sushi")),
+    ("Subscriptions", ("patreon", "netflix", "spotify", "youtube", "apple", "google", "amazon prime")),
+    ("Health & Fitness", ("pharmacy", "farmacia", "gym", "yoga", "fitness", "health")),
+    ("Shopping", ("amazon", "ebay", "aliexpress", "shop", "store", "market")),
+)
+
+# One compiled pattern per category, so each is a single scan of the merchant name
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for category, keywords in MERCHANT_CATEGORIES
+)
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def strip_tags(text: str) -> str:
+    """Remove HTML tags (Wise wraps parts of activity titles in <strong>)."""
+    return _TAG_RE.sub('', text) if '<' in text else text
+
+
+@functools.lru_cache(maxsize=4096)
+def categorize_merchant(merchant: str) -> str:
+    """Categorize merchant based on name (merchants repeat, so results are cached)."""
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(merchant):
+            return category
+    
+    return "Card Payment"
+
+
+def _statement_request(profile_id: int, borderless_account_id: int, days: int, now: Optional[datetime] = None) -> Tuple[str, Dict[str, str]]:
+    """Build the URL and query parameters of a jar statement covering the last `days` days."""
+    if now is None:
+        now = datetime.now()
+    now = now.replace(microsecond=0)
+    start = now - timedelta(days=days)
+    
+    params = {
+        "intervalStart": start.isoformat(timespec="milliseconds") + "Z",
+        "intervalEnd": now.isoformat(timespec="milliseconds") + "Z",
+        "type": "COMPLETED"
+    }
+    return f"/profiles/{profile_id}/borderless-accounts/{borderless_account_id}/statement.json", params
+
+
+def _merge_jar_transactions(balances: List[Dict[str, Any]], results: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Combine per-jar statements (or the exception raised fetching each one),
+    tagging every transaction with its jar's currency.
+    """
+    all_txs = []
+    for b_acc, txs in zip(balances, results):
+        if isinstance(txs, Exception):
+            print(f"Failed to fetch transactions for account {b_acc.get('id')}: {txs}")
+            continue
+        for tx in txs:
+            tx["_account_currency"] = b_acc.get("currency")
+        all_txs.extend(txs)
+    
+    return sorted(all_txs, key=lambda x: x.get("date", ""), reverse=True)
+
+
+def parse_transfers(transfers: List[Dict[str, Any]], days: int) -> List[Dict[str, Any]]:
+    """Normalize /transfers results from the last `days` days, newest first."""
+    now = datetime.now()
+    start_date = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    processed = []
+    for tx in transfers:
+        status = tx.get("status", "")
+        if status not in TRANSFER_STATUSES:
+            continue
+        
+        try:
+            tx_date = parse_timestamp(tx.get("created") or "")
+        except ValueError:
+            continue
+        
+        if tx_date < start_date or tx_date > now:
+            continue
+        
+        source_value = tx.get("sourceValue", 0)
+        source_currency = tx.get("sourceCurrency", "EUR")
+        target_currency = tx.get("targetCurrency", "EUR")
+        reference = tx.get("reference", "") or tx.get("details", {}).get("reference", "")
+        
+        # Check if this is an incoming transfer (sourceAccount is null = money coming IN)
+        source_account = tx.get("sourceAccount")
+        is_incoming = source_account is None
+        
+        if source_currency != target_currency:
+            desc = f"{reference or 'Transfer'} ({source_currency}→{target_currency})"
+        else:
+            desc = reference or "Bank Transfer"
+        
+        processed.append({
+            "date": tx_date,
+            "description": desc,
+            "amount": source_value if is_incoming else -source_value,
+            "currency": source_currency,
+            "mcc": None,
+            "category": "Bank Transfer",
+            "source": "Wise",
+            "account_type": "transfer",
+            "is_expense": not is_incoming
+        })
+    
+    return sorted(processed, key=itemgetter("date"), reverse=True)
+
+
+def _activity_params(start_date: datetime, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """Query parameters for one page of /activities."""
+    # Let the server drop activities older than the period instead of paging through them
+    params = {"size": 100, "since": start_date.strftime("%Y-%m-%dT%H:%M:%S.000Z")}
+    if cursor:
+        params["cursor"] = cursor
+    return params
+
+
+def parse_card_activities(
+    activities: List[Dict[str, Any]],
+    start_date: datetime,
+    now: datetime,
+    prev_page_ids: set,
+    processed: List[Dict[str, Any]]
+) -> Tuple[set, bool]:
+    """
+    Append the card payments of one activities page to `processed`.
+    Pages only overlap at their boundary, so activities are deduplicated against the previous page.
+    Returns the ids seen on this page and whether the page reached `start_date`.
+    """
+    page_ids = set()
+    reached_start = False
+    for act in activities:
+        act_id = act.get("id")
+        if act_id in prev_page_ids or act_id in page_ids:
+            continue
+        page_ids.add(act_id)
+        
+        # Check the date of every activity (not just card payments), so older
+        # transfers etc. also end pagination when the server ignores `since`
+        try:
+            tx_date = parse_timestamp(act.get("createdOn") or "")
+        except ValueError:
+            continue
+        
+        if tx_date < start_date:
+            # Activities are newest-first, so everything after this is older too
+            reached_start = True
+            break
+        
+        act_type = act.get("type", "")
+        status = act.get("status", "")
+        
+        if act_type != "CARD_PAYMENT":
+            continue
+        if status not in CARD_PAYMENT_STATUSES:
+            continue
+        if tx_date > now:
+            continue
+        
+        primary_amount = act.get("primaryAmount", "")
+        amount, currency = parse_amount_string(primary_amount)
+        
+        secondary = act.get("secondaryAmount", "")
+        if secondary:
+            sec_amount, sec_currency = parse_amount_string(secondary)
+            if sec_amount > 0:
+                amount = sec_amount
+                currency = sec_currency
+        
+        title = act.get("title", "Unknown")
+        title = strip_tags(title).strip()
+        
+        category = categorize_merchant(title)
+        
+        processed.append({
+            "date": tx_date,
+            "description": title,
+            "amount": -amount,
+            "currency": currency,
+            "mcc": None,
+            "category": category,
+            "source": "Wise",
+            "account_type": "card",
+            "is_expense": True
+        })
+    
+    return page_ids, reached_start
+
+
 class WiseClient:
     BASE_URL = "https://api.wise.com/v1"
 
@@ -39,37 +275,77 @@ class WiseClient:
         self.client = httpx.Client(
             base_url=self.BASE_URL,
             headers=self.headers,
-            timeout=30.0
+            timeout=30.0,
+            transport=httpx.HTTPTransport(http2=True, limits=HTTP_LIMITS, retries=CONNECT_RETRIES)
         )
         self._profile_id = os.environ.get("WISE_PROFILE_ID")
+        # A configured WISE_PROFILE_ID never expires; discovered ids expire after PROFILE_ID_TTL
+        self._profile_id_expires: Optional[float] = None
+        self._balance_ttl = _env_seconds("WISE_BALANCE_TTL", BALANCE_TTL)
+        # Jar list per profile, reused by get_transactions; get_balances always fetches fresh amounts
+        self._jars_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._async_clients = PerLoopAsyncClient(lambda: httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=self.headers,
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=CONNECT_RETRIES)
+        ))
 
-    def _get_profile_id(self) -> int:
-        if self._profile_id:
+    def _cached_profile_id(self) -> Optional[int]:
+        if self._profile_id and (self._profile_id_expires is None or time.monotonic() < self._profile_id_expires):
             return int(self._profile_id)
+        return None
+
+    def _get_profile_id(self) -> int:
+        pid = self._cached_profile_id()
+        if pid is not None:
+            return pid
         
-        profiles = self.get_profiles()
-        for p in profiles:
-            if p.get("type") == "personal":
-                self._profile_id = p.get("id")
-                return self._profile_id
+        return self._select_profile_id(self.get_profiles())
+
+    async def _get_profile_id_async(self, client: httpx.AsyncClient) -> int:
+        pid = self._cached_profile_id()
+        if pid is not None:
+            return pid
         
-        if profiles:
-            return profiles[0].get("id")
-            
-        raise ValueError("No Wise profiles found for this account")
+        response = await client.get("/profiles")
+        response.raise_for_status()
+        return self._select_profile_id(orjson.loads(response.content))
+
+    def _select_profile_id(self, profiles: List[Dict[str, Any]]) -> int:
+        """Pick the personal profile, falling back to the first one, and cache it for PROFILE_ID_TTL."""
+        if not profiles:
+            raise ValueError("No Wise profiles found for this account")
+        
+        profile = next((p for p in profiles if p.get("type") == "personal"), profiles[0])
+        self._profile_id = profile.get("id")
+        self._profile_id_expires = time.monotonic() + PROFILE_ID_TTL
+        return self._profile_id
 
     def get_profiles(self) -> List[Dict[str, Any]]:
         """List all profiles associated with the user."""
         response = self.client.get("/profiles")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    def _cached_jars(self, profile_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the jar list fetched within the last WISE_BALANCE_TTL seconds, if any."""
+        cached = self._jars_cache.get(profile_id)
+        if cached and time.monotonic() - cached[0] < self._balance_ttl:
+            return cached[1]
+        return None
+
+    def _store_balances(self, profile_id: int, response: httpx.Response) -> List[Dict[str, Any]]:
+        """Decode a /borderless-accounts response and remember it as the profile's jar list."""
+        response.raise_for_status()
+        balances = orjson.loads(response.content)
+        self._jars_cache[profile_id] = (time.monotonic(), balances)
+        return balances
 
     def get_balances(self, profile_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get account balances (jars) for a profile."""
         pid = profile_id or self._get_profile_id()
-        response = self.client.get(f"/borderless-accounts?profileId={pid}")
-        response.raise_for_status()
-        return response.json()
+        return self._store_balances(pid, self.client.get(f"/borderless-accounts?profileId={pid}"))
 
     def get_transactions(self, profile_id: Optional[int] = None, borderless_account_id: Optional[int] = None, days: int = 30) -> List[Dict[str, Any]]:
         """
@@ -77,93 +353,73 @@ class WiseClient:
         """
         pid = profile_id or self._get_profile_id()
         
-        if not borderless_account_id:
+        if borderless_account_id:
+            return self._fetch_account_transactions_sync(pid, borderless_account_id, days)
+        
+        balances = self._cached_jars(pid)
+        if balances is None:
             balances = self.get_balances(pid)
-            all_txs = []
-            for b_acc in balances:
-                bid = b_acc.get("id")
-                try:
-                    txs = self._fetch_account_transactions(pid, bid, days)
-                    for tx in txs:
-                        tx["_account_currency"] = b_acc.get("currency")
-                    all_txs.extend(txs)
-                except Exception as e:
-                    print(f"Failed to fetch transactions for account {bid}: {e}")
-            
-            return sorted(all_txs, key=lambda x: x.get("date", ""), reverse=True)
-            
-        return self._fetch_account_transactions(pid, borderless_account_id, days)
-
-    def _fetch_account_transactions(self, profile_id: int, borderless_account_id: int, days: int) -> List[Dict[str, Any]]:
-        """Internal helper to fetch statements for a specific jar."""
+        
         now = datetime.now()
-        start = now - timedelta(days=days)
+        results = []
+        for b_acc in balances:
+            try:
+                results.append(self._fetch_account_transactions_sync(pid, b_acc.get("id"), days, now))
+            except Exception as e:
+                results.append(e)
         
-        params = {
-            "intervalStart": start.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-            "intervalEnd": now.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-            "type": "COMPLETED"
-        }
+        return _merge_jar_transactions(balances, results)
+
+    async def get_transactions_async(self, profile_id: Optional[int] = None, borderless_account_id: Optional[int] = None, days: int = 30) -> List[Dict[str, Any]]:
+        """
+        Async variant of get_transactions.
+        Statements for all jars are requested concurrently.
+        """
+        client = self._async_clients.get()
+        pid = profile_id or await self._get_profile_id_async(client)
+        
+        if borderless_account_id:
+            return await self._fetch_account_transactions(client, pid, borderless_account_id, days)
+        
+        balances = self._cached_jars(pid)
+        if balances is None:
+            balances = self._store_balances(pid, await client.get(f"/borderless-accounts?profileId={pid}"))
         
-        url = f"/profiles/{profile_id}/borderless-accounts/{borderless_account_id}/statement.json"
+        now = datetime.now()
+        results = await asyncio.gather(
+            *(self._fetch_account_transactions(client, pid, b_acc.get("id"), days, now) for b_acc in balances),
+            return_exceptions=True
+        )
+        
+        return _merge_jar_transactions(balances, results)
+
+    def _fetch_account_transactions_sync(self, profile_id: int, borderless_account_id: int, days: int, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Blocking variant of _fetch_account_transactions, using the pooled sync client."""
+        url, params = _statement_request(profile_id, borderless_account_id, days, now)
         response = self.client.get(url, params=params)
         response.raise_for_status()
-        
-        data = response.json()
-        txs = data.get("transactions", [])
-        return txs
+        return orjson.loads(response.content).get("transactions", [])
+
+    async def _fetch_account_transactions(self, client: httpx.AsyncClient, profile_id: int, borderless_account_id: int, days: int, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Internal helper to fetch statements for a specific jar.
+        Pass the same `now` for every jar so all statements cover an identical interval.
+        """
+        url, params = _statement_request(profile_id, borderless_account_id, days, now)
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content).get("transactions", [])
 
     def get_transfers(self, days: int = 14) -> List[Dict[str, Any]]:
         """Fetch bank transfers (outgoing payments) from Wise."""
-        now = datetime.now()
-        start_date = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
-        
         response = self.client.get("/transfers", params={"limit": 200})
         response.raise_for_status()
-        transfers = response.json()
-        
-        processed = []
-        for tx in transfers:
-            status = tx.get("status", "")
-            if status not in ["outgoing_payment_sent", "funds_converted"]:
-                continue
-            
-            created = tx.get("created", "")
-            try:
-                tx_date = datetime.strptime(created, "%Y-%m-%d %H:%M:%S")
-            except:
-                continue
-            
-            if tx_date < start_date or tx_date > now:
-                continue
-            
-            source_value = tx.get("sourceValue", 0)
-            source_currency = tx.get("sourceCurrency", "EUR")
-            target_currency = tx.get("targetCurrency", "EUR")
-            reference = tx.get("reference", "") or tx.get("details", {}).get("reference", "")
-            
-            # Check if this is an incoming transfer (sourceAccount is null = money coming IN)
-            source_account = tx.get("sourceAccount")
-            is_incoming = source_account is None
-            
-            if source_currency != target_currency:
-                desc = f"{reference or 'Transfer'} ({source_currency}→{target_currency})"
-            else:
-                desc = reference or "Bank Transfer"
-            
-            processed.append({
-                "date": tx_date,
-                "description": desc,
-                "amount": source_value if is_incoming else -source_value,
-                "currency": source_currency,
-                "mcc": None,
-                "category": "Bank Transfer",
-                "source": "Wise",
-                "account_type": "transfer",
-                "is_expense": not is_incoming
-            })
-        
-        return sorted(processed, key=lambda x: x["date"], reverse=True)
+        return parse_transfers(orjson.loads(response.content), days)
+
+    async def _fetch_transfers(self, client: httpx.AsyncClient, days: int) -> List[Dict[str, Any]]:
+        response = await client.get("/transfers", params={"limit": 200})
+        response.raise_for_status()
+        return parse_transfers(orjson.loads(response.content), days)
 
     def get_card_transactions(self, days: int = 14) -> List[Dict[str, Any]]:
         """Fetch card transactions from Wise using the activities endpoint."""
@@ -173,120 +429,77 @@ class WiseClient:
         
         processed = []
         cursor = None
-        seen_ids = set()
+        prev_page_ids = set()
         
         while True:
-            params = {"size": 100}
-            if cursor:
-                params["cursor"] = cursor
-            
-            response = self.client.get(f"/profiles/{pid}/activities", params=params)
+            response = self.client.get(f"/profiles/{pid}/activities", params=_activity_params(start_date, cursor))
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             activities = data.get("activities", [])
             if not activities:
                 break
             
-            for act in activities:
-                act_id = act.get("id")
-                if act_id in seen_ids:
-                    continue
-                seen_ids.add(act_id)
-                
-                act_type = act.get("type", "")
-                status = act.get("status", "")
-                
-                if act_type != "CARD_PAYMENT":
-                    continue
-                if status not in ["COMPLETED", "PENDING"]:
-                    continue
-                
-                created = act.get("createdOn", "")
-                try:
-                    tx_date = datetime.fromisoformat(created.replace("Z", "+00:00")).replace(tzinfo=None)
-                except:
-                    continue
-                
-                if tx_date < start_date:
-                    break
-                if tx_date > now:
-                    continue
-                
-                primary_amount = act.get("primaryAmount", "")
-                amount, currency = parse_amount_string(primary_amount)
-                
-                secondary = act.get("secondaryAmount", "")
-                if secondary:
-                    sec_amount, sec_currency = parse_amount_string(secondary)
-                    if sec_amount > 0:
-                        amount = sec_amount
-                        currency = sec_currency
-                
-                title = act.get("title", "Unknown")
-                title = re.sub(r'<[^>]+>', '', title).strip()
-                
-                category = self._categorize_merchant(title)
-                
-                processed.append({
-                    "date": tx_date,
-                    "description": title,
-                    "amount": -amount,
-                    "currency": currency,
-                    "mcc": None,
-                    "category": category,
-                    "source": "Wise",
-                    "account_type": "card",
-                    "is_expense": True
-                })
+            prev_page_ids, reached_start = parse_card_activities(activities, start_date, now, prev_page_ids, processed)
+            cursor = data.get("cursor")
+            if reached_start or not cursor:
+                break
+        
+        return sorted(processed, key=itemgetter("date"), reverse=True)
+
+    async def _fetch_card_transactions(self, client: httpx.AsyncClient, days: int) -> List[Dict[str, Any]]:
+        pid = await self._get_profile_id_async(client)
+        now = datetime.now()
+        start_date = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        processed = []
+        cursor = None
+        prev_page_ids = set()
+        
+        while True:
+            response = await client.get(f"/profiles/{pid}/activities", params=_activity_params(start_date, cursor))
+            response.raise_for_status()
+            data = orjson.loads(response.content)
             
-            if activities:
-                last_created = activities[-1].get("createdOn", "")
-                try:
-                    last_date = datetime.fromisoformat(last_created.replace("Z", "+00:00")).replace(tzinfo=None)
-                    if last_date < start_date:
-                        break
-                except:
-                    pass
+            activities = data.get("activities", [])
+            if not activities:
+                break
             
+            prev_page_ids, reached_start = parse_card_activities(activities, start_date, now, prev_page_ids, processed)
             cursor = data.get("cursor")
-            if not cursor:
+            if reached_start or not cursor:
                 break
         
-        return sorted(processed, key=lambda x: x["date"], reverse=True)
+        return sorted(processed, key=itemgetter("date"), reverse=True)
 
     def _categorize_merchant(self, merchant: str) -> str:
         """Categorize merchant based on name."""
-        merchant_lower = merchant.lower()
-        
-        if any(x in merchant_lower for x in ["uber", "bolt", "lyft", "taxi", "cabify"]):
-            return "Transport"
-        
-        if any(x in merchant_lower for x in ["lidl", "aldi", "pingo doce", "continente", "mercado", "supermarket", "grocery"]):
-            return "Groceries"
-        
-        if any(x in merchant_lower for x in ["restaurant", "cafe", "coffee", "starbucks", "mcdonald", "burger", "pizza", "sushi"]):
-            return "Restaurants"
-        
-        if any(x in merchant_lower for x in ["patreon", "netflix", "spotify", "youtube", "apple", "google", "amazon prime"]):
-            return "Subscriptions"
-        
-        if any(x in merchant_lower for x in ["pharmacy", "farmacia", "gym", "yoga", "fitness", "health"]):
-            return "Health & Fitness"
-        
-        if any(x in merchant_lower for x in ["amazon", "ebay", "aliexpress", "shop", "store", "market"]):
-            return "Shopping"
-        
-        return "Card Payment"
+        return categorize_merchant(merchant)
 
     def get_all_transactions(self, days: int = 14) -> List[Dict[str, Any]]:
         """Fetch ALL transactions from Wise (card payments + bank transfers)."""
-        card_txs = self.get_card_transactions(days=days)
-        transfer_txs = self.get_transfers(days=days)
+        card_txs = self.get_card_transactions(days)
+        transfer_txs = self.get_transfers(days)
+        # Both lists are already newest-first, so merging them is linear
+        return list(heapq.merge(card_txs, transfer_txs, key=itemgetter("date"), reverse=True))
+
+    async def get_all_transactions_async(self, days: int = 14) -> List[Dict[str, Any]]:
+        """
+        Async variant of get_all_transactions.
+        Card payments and bank transfers are fetched concurrently.
+        """
+        client = self._async_clients.get()
+        card_txs, transfer_txs = await asyncio.gather(
+            self._fetch_card_transactions(client, days),
+            self._fetch_transfers(client, days)
+        )
         
-        all_txs = card_txs + transfer_txs
-        return sorted(all_txs, key=lambda x: x["date"], reverse=True)
+        # Both lists are already newest-first, so merging them is linear
+        return list(heapq.merge(card_txs, transfer_txs, key=itemgetter("date"), reverse=True))
+
+    async def aclose(self):
+        """Close the async client bound to the running event loop, if any."""
+        await self._async_clients.aclose()
 
     def close(self):
         self.client.close()
-
@@ -7,79 +7,281 @@ Supports Bearer token authentication via:
   - MCP_AUTH_TOKEN environment variable
 """
 import asyncio
+import hashlib
+import io
+import json
 import os
+import sys
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+import httpx
 from mcp import ClientSession
 from mcp.client.sse import sse_client
+from mcp.shared.exceptions import McpError
+from mcp.types import METHOD_NOT_FOUND, Tool
 import dotenv
 dotenv.load_dotenv()
 
 SERVER_URL = "http://localhost:8000/sse"
 
+# Tool schemas rarely change, so `list`/`full` reuse them across runs (--refresh forces a reload)
+TOOLS_CACHE_TTL = 3600
+REFRESH_TOOLS = False
+
 # Get auth token from environment or command line
 AUTH_TOKEN = os.environ.get("MCP_AUTH_TOKEN")
 
 
-def get_headers():
+def _build_headers(token: Optional[str]) -> Mapping[str, str]:
+    """Build the (read-only) request headers once for the final auth token."""
+    return MappingProxyType({"Authorization": f"Bearer {token}"} if token else {})
+
+
+_HEADERS = _build_headers(AUTH_TOKEN)
+
+
+def get_headers() -> Mapping[str, str]:
     """Get HTTP headers including auth if configured."""
-    if AUTH_TOKEN:
-        return {"Authorization": f"Bearer {AUTH_TOKEN}"}
-    return {}
+    return _HEADERS
+
+
+def _parse_token(argv: list) -> tuple:
+    """Strip `--token <token>` from argv; returns (remaining args, token or None)."""
+    if "--token" not in argv:
+        return argv, None
+    idx = argv.index("--token")
+    if idx + 1 >= len(argv):
+        print("Error: --token requires a value")
+        sys.exit(1)
+    return argv[:idx] + argv[idx + 2:], argv[idx + 1]
+
+
+def _http_client_factory(headers=None, timeout=None, auth=None) -> httpx.AsyncClient:
+    """
+    HTTP client for sse_client. It carries both the SSE stream and every
+    tool-call POST, so it is a keep-alive pool (HTTP/2 where the server offers it).
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+    )
+
+
+# One SSE connection + initialized session, shared by every call in this process
+_exit_stack: Optional[AsyncExitStack] = None
+_session: Optional[ClientSession] = None
+
+
+async def _get_session() -> ClientSession:
+    """Connect and initialize on first use; later calls reuse the same session."""
+    global _exit_stack, _session
+    if _session is None:
+        stack = AsyncExitStack()
+        try:
+            read, write = await stack.enter_async_context(sse_client(SERVER_URL, headers=get_headers(), httpx_client_factory=_http_client_factory))
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+        except BaseException:
+            await stack.aclose()
+            raise
+        _exit_stack, _session = stack, session
+    return _session
+
+
+async def _close_session():
+    """Tear down the shared session (must run in the task that opened it)."""
+    global _exit_stack, _session
+    if _exit_stack is not None:
+        stack, _exit_stack, _session = _exit_stack, None, None
+        await stack.aclose()
+
+
+async def _run(coro):
+    """Run a test coroutine, then close the shared session."""
+    try:
+        return await coro
+    finally:
+        await _close_session()
+
+
+def _tools_cache_path() -> Path:
+    """Cache file per server URL + token, so different servers/users never mix."""
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp_test"
+    key = hashlib.sha1(f"{SERVER_URL}|{AUTH_TOKEN or ''}".encode()).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _load_cached_tools() -> Optional[list]:
+    """Return the cached tool list if it is fresh enough, otherwise None."""
+    if REFRESH_TOOLS:
+        return None
+    path = _tools_cache_path()
+    try:
+        if time.time() - path.stat().st_mtime > TOOLS_CACHE_TTL:
+            return None
+        return [Tool.model_validate(tool) for tool in json.loads(path.read_text(encoding="utf-8"))]
+    except (OSError, ValueError):
+        return None
+
+
+def _save_tools(tools: list):
+    path = _tools_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([tool.model_dump(mode="json", exclude_none=True) for tool in tools]), encoding="utf-8")
+    except OSError:
+        pass
+
+
+async def _list_tools() -> list:
+    """Tool list from the disk cache, or from the server (refreshing the cache)."""
+    tools = _load_cached_tools()
+    if tools is None:
+        session = await _get_session()
+        tools = (await session.list_tools()).tools
+        _save_tools(tools)
+    return tools
+
+
+def _output_buffer():
+    """
+    Collect a command's output in memory and write it to stdout in one go,
+    instead of one line-buffered write per print.
+    """
+    buf = io.StringIO()
+    
+    def line(text: str = ""):
+        buf.write(text)
+        buf.write("\n")
+    
+    return buf, line
 
 
 async def test_list_tools():
     """List all available tools from the server."""
-    print(f"Connecting to {SERVER_URL}...")
-    if AUTH_TOKEN:
-        print("Using authentication token")
+    tools = _load_cached_tools()
+    if tools is None:
+        print(f"Connecting to {SERVER_URL}...")
+        if AUTH_TOKEN:
+            print("Using authentication token")
+        tools = await _list_tools()
+    else:
+        print(f"Using cached tool list for {SERVER_URL} (pass --refresh to reload)")
     
-    async with sse_client(SERVER_URL, headers=get_headers()) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            
-            print("\n" + "=" * 60)
-            print("Available Tools")
-            print("=" * 60)
-            
-            tools_result = await session.list_tools()
-            
-            for tool in tools_result.tools:
-                print(f"\n📌 {tool.name}")
-                print(f"   {tool.description}")
-                if tool.inputSchema and tool.inputSchema.get("properties"):
-                    print("   Arguments:")
-                    for prop_name, prop_details in tool.inputSchema["properties"].items():
-                        default = prop_details.get("default", "")
-                        default_str = f" (default: {default})" if default else ""
-                        print(f"     - {prop_name}: {prop_details.get('type', 'any')}{default_str}")
-            
-            print(f"\n✅ Total: {len(tools_result.tools)} tools available")
+    buf, line = _output_buffer()
+    line("\n" + "=" * 60)
+    line("Available Tools")
+    line("=" * 60)
+    
+    for tool in tools:
+        line(f"\n📌 {tool.name}")
+        line(f"   {tool.description}")
+        if tool.inputSchema and tool.inputSchema.get("properties"):
+            line("   Arguments:")
+            for prop_name, prop_details in tool.inputSchema["properties"].items():
+                default = prop_details.get("default", "")
+                default_str = f" (default: {default})" if default else ""
+                line(f"     - {prop_name}: {prop_details.get('type', 'any')}{default_str}")
+    
+    line(f"\n✅ Total: {len(tools)} tools available")
+    sys.stdout.write(buf.getvalue())
+
+
+# Tool-name prefixes of tools that talk to a single bank
+BANK_PREFIXES = ("monobank", "wise")
+
+
+async def _call_tools(session: ClientSession, calls: list) -> list:
+    """
+    Run (tool, arguments) calls concurrently and return results (or exceptions) in order.
+    Calls to the same bank run one after another, so e.g. the portfolio reuses the
+    server's cached client-info instead of tripping Monobank's rate limit. Tools that
+    span banks (like generate_report) run after all bank chains have finished.
+    """
+    chains = {}
+    cross_bank = []
+    for index, (tool, arguments) in enumerate(calls):
+        prefix = tool.split("_", 1)[0]
+        if prefix in BANK_PREFIXES:
+            chains.setdefault(prefix, []).append((index, tool, arguments))
+        else:
+            cross_bank.append((index, tool, arguments))
+    
+    results = [None] * len(calls)
+    
+    async def run_chain(chain):
+        for index, tool, arguments in chain:
+            try:
+                results[index] = await session.call_tool(tool, arguments=arguments)
+            except Exception as e:
+                results[index] = e
+    
+    await asyncio.gather(*(run_chain(chain) for chain in chains.values()))
+    await run_chain(cross_bank)
+    return results
 
 
 async def test_call_tool(tool_name: str, arguments: dict = None):
     """Call a specific tool and display the result."""
+    await test_call_many([(tool_name, arguments or {})])
+
+
+async def test_call_many(calls: list):
+    """Call several tools over one session concurrently and display results in order."""
     print(f"\nConnecting to {SERVER_URL}...")
     if AUTH_TOKEN:
         print("Using authentication token")
     
-    async with sse_client(SERVER_URL, headers=get_headers()) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            
-            print(f"\n🔧 Calling: {tool_name}")
-            if arguments:
-                print(f"   Arguments: {arguments}")
-            
-            result = await session.call_tool(tool_name, arguments=arguments or {})
-            
-            if result.content:
-                text = result.content[0].text
-                # Truncate if very long
-                if len(text) > 2000:
-                    print(f"\n{text[:2000]}...\n\n[Truncated - {len(text)} total chars]")
-                else:
-                    print(f"\n{text}")
+    session = await _get_session()
+    results = await _call_tools(session, calls)
+    
+    buf, line = _output_buffer()
+    for (tool_name, arguments), result in zip(calls, results):
+        line(f"\n🔧 Calling: {tool_name}")
+        if arguments:
+            line(f"   Arguments: {arguments}")
+        
+        if isinstance(result, Exception):
+            line(f"❌ Error: {result}")
+        elif result.content:
+            text = result.content[0].text
+            # Truncate if very long
+            if len(text) > 2000:
+                line(f"\n{text[:2000]}...\n\n[Truncated - {len(text)} total chars]")
             else:
-                print("No content returned.")
+                line(f"\n{text}")
+        else:
+            line("No content returned.")
+    
+    sys.stdout.write(buf.getvalue())
+
+
+# Tools exercised by `full`: (name, arguments, characters of output to show).
+# Tools missing on the server are reported as skipped.
+FULL_TEST_CALLS = [
+    ("monobank_get_client_info", {}, 500),
+    ("monobank_get_portfolio", {}, 500),
+    ("wise_get_profiles", {}, 500),
+    ("wise_get_balances", {}, 500),
+    ("generate_report", {"days": 7}, 1000),
+]
+
+
+def _is_unknown_tool(result) -> bool:
+    """Whether a call failed only because the server has no such tool."""
+    if isinstance(result, McpError):
+        return result.error.code == METHOD_NOT_FOUND or result.error.message.startswith("Unknown tool")
+    if isinstance(result, Exception):
+        return False
+    # FastMCP reports unknown tools as an error result rather than a protocol error
+    return bool(result.isError and result.content and getattr(result.content[0], "text", "").startswith("Unknown tool"))
 
 
 async def run_full_test():
@@ -90,136 +292,107 @@ async def run_full_test():
     if AUTH_TOKEN:
         print("Using authentication token")
     
-    async with sse_client(SERVER_URL, headers=get_headers()) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            
-            # List tools first
-            tools_result = await session.list_tools()
-            tool_names = [t.name for t in tools_result.tools]
-            print(f"\n✅ Connected! Found {len(tool_names)} tools: {', '.join(tool_names)}")
-            
-            # Test Monobank tools
-            if "monobank_get_client_info" in tool_names:
-                print("\n" + "-" * 40)
-                print("Testing: monobank_get_client_info")
-                print("-" * 40)
-                try:
-                    result = await session.call_tool("monobank_get_client_info")
-                    if result.content:
-                        print(result.content[0].text[:500])
-                except Exception as e:
-                    print(f"❌ Error: {e}")
-            
-            if "monobank_get_portfolio" in tool_names:
-                print("\n" + "-" * 40)
-                print("Testing: monobank_get_portfolio")
-                print("-" * 40)
-                try:
-                    result = await session.call_tool("monobank_get_portfolio")
-                    if result.content:
-                        print(result.content[0].text[:500])
-                except Exception as e:
-                    print(f"❌ Error: {e}")
-            
-            # Test Wise tools
-            if "wise_get_profiles" in tool_names:
-                print("\n" + "-" * 40)
-                print("Testing: wise_get_profiles")
-                print("-" * 40)
-                try:
-                    result = await session.call_tool("wise_get_profiles")
-                    if result.content:
-                        print(result.content[0].text[:500])
-                except Exception as e:
-                    print(f"❌ Error: {e}")
-            
-            if "wise_get_balances" in tool_names:
-                print("\n" + "-" * 40)
-                print("Testing: wise_get_balances")
-                print("-" * 40)
-                try:
-                    result = await session.call_tool("wise_get_balances")
-                    if result.content:
-                        print(result.content[0].text[:500])
-                except Exception as e:
-                    print(f"❌ Error: {e}")
-            
-            # Test Report tool
-            if "generate_report" in tool_names:
-                print("\n" + "-" * 40)
-                print("Testing: generate_report (days=7)")
-                print("-" * 40)
-                try:
-                    result = await session.call_tool("generate_report", arguments={"days": 7})
-                    if result.content:
-                        text = result.content[0].text
-                        print(text[:1000] + "..." if len(text) > 1000 else text)
-                except Exception as e:
-                    print(f"❌ Error: {e}")
-    
-    print("\n" + "=" * 60)
-    print("Test Complete!")
-    print("=" * 60)
+    session = await _get_session()
+    print("\n✅ Connected!")
+    
+    # No list_tools round-trip: call the known tools directly and skip any the server lacks
+    results = await _call_tools(session, [(tool, arguments) for tool, arguments, _ in FULL_TEST_CALLS])
+    
+    buf, line = _output_buffer()
+    for (tool, arguments, preview_chars), result in zip(FULL_TEST_CALLS, results):
+        args_str = ", ".join(f"{k}={v}" for k, v in arguments.items())
+        line("\n" + "-" * 40)
+        line(f"Testing: {tool} ({args_str})" if args_str else f"Testing: {tool}")
+        line("-" * 40)
+        if _is_unknown_tool(result):
+            line("⏭️  Skipped: not available on this server")
+        elif isinstance(result, Exception):
+            line(f"❌ Error: {result}")
+        elif result.content:
+            text = result.content[0].text
+            line(text[:preview_chars] + "..." if len(text) > preview_chars else text)
+    
+    line("\n" + "=" * 60)
+    line("Test Complete!")
+    line("=" * 60)
+    sys.stdout.write(buf.getvalue())
+
+
+def _coerce(value: str):
+    """Turn a CLI `key=value` string into an int, float or bool where it looks like one."""
+    digits = value[1:] if value.startswith("-") else value
+    if digits.isdecimal():
+        return int(value)
+    if digits.replace(".", "", 1).isdecimal():
+        return float(value)
+    if value in ("true", "false"):
+        return value == "true"
+    return value
+
+
+def _parse_calls(tokens: list) -> Optional[list]:
+    """
+    Split CLI tokens into (tool, arguments) calls: tool names, each followed by its key=value pairs.
+    Returns None for malformed input (arguments before any tool, or a bare value where a tool name belongs).
+    """
+    calls = []
+    for token in tokens:
+        if "=" in token:
+            if not calls:
+                return None
+            k, v = token.split("=", 1)
+            calls[-1][1][k] = _coerce(v)
+        elif token.isidentifier():
+            calls.append((token, {}))
+        else:
+            return None
+    return calls
 
 
 def print_usage():
     print("Usage:")
-    print("  python test_mcp_server.py [--token TOKEN] list              - List all tools")
-    print("  python test_mcp_server.py [--token TOKEN] call <tool> [args] - Call a specific tool")
+    print("  python test_mcp_server.py [--token TOKEN] [--refresh] list  - List all tools")
+    print("  python test_mcp_server.py [--token TOKEN] call <tool> [args] [<tool> [args]...]")
+    print("                                                               - Call one or more tools")
     print("  python test_mcp_server.py [--token TOKEN] full              - Run full test suite")
     print("")
     print("Authentication:")
     print("  --token TOKEN        Pass auth token via command line")
     print("  MCP_AUTH_TOKEN env   Or set this environment variable")
     print("")
+    print("Caching:")
+    print(f"  Tool lists are cached for {TOOLS_CACHE_TTL // 60} minutes; --refresh reloads them")
+    print("")
     print("Examples:")
     print("  python test_mcp_server.py list")
     print("  python test_mcp_server.py --token mysecret list")
     print("  MCP_AUTH_TOKEN=mysecret python test_mcp_server.py list")
     print("  python test_mcp_server.py call monobank_get_portfolio")
     print("  python test_mcp_server.py call generate_report days=7")
+    print("  python test_mcp_server.py call monobank_get_portfolio wise_get_transactions days=7")
 
 
 if __name__ == "__main__":
-    import sys
-    
-    # Parse --token argument
-    args = sys.argv[1:]
-    if "--token" in args:
-        idx = args.index("--token")
-        if idx + 1 < len(args):
-            AUTH_TOKEN = args[idx + 1]
-            args = args[:idx] + args[idx + 2:]
-        else:
-            print("Error: --token requires a value")
-            sys.exit(1)
-    
-    if len(args) > 0:
-        cmd = args[0]
-        if cmd == "list":
-            asyncio.run(test_list_tools())
-        elif cmd == "call" and len(args) > 1:
-            tool_name = args[1]
-            # Simple arg parsing: key=value pairs
-            tool_args = {}
-            for arg in args[2:]:
-                if "=" in arg:
-                    k, v = arg.split("=", 1)
-                    # Try to parse as int
-                    try:
-                        v = int(v)
-                    except ValueError:
-                        pass
-                    tool_args[k] = v
-            asyncio.run(test_call_tool(tool_name, tool_args))
-        elif cmd == "full":
-            asyncio.run(run_full_test())
-        elif cmd in ["--help", "-h", "help"]:
-            print_usage()
-        else:
-            print_usage()
+    # Parse --token argument before anything connects, so headers are built once
+    args, token = _parse_token(sys.argv[1:])
+    if token:
+        AUTH_TOKEN = token
+        _HEADERS = _build_headers(AUTH_TOKEN)
+    if "--refresh" in args:
+        args.remove("--refresh")
+        REFRESH_TOOLS = True
+    
+    # Pick the command first, then run it on the process's single event loop
+    cmd = args[0] if args else "list"
+    if cmd == "list":
+        command = test_list_tools()
+    elif cmd == "call" and (calls := _parse_calls(args[1:])):
+        command = test_call_many(calls)
+    elif cmd == "full":
+        command = run_full_test()
     else:
-        # Default: list tools
-        asyncio.run(test_list_tools())
-
+        command = None
+        print_usage()
+    
+    if command is not None:
+        asyncio.run(_run(command))